@@ -5,6 +5,8 @@ WitcherAgents using transfer_to_agent(). ADK's AutoFlow mechanism intercepts
 these calls and routes execution to the target agent.
 """
 
+from functools import lru_cache
+
 from google.adk.agents import LlmAgent
 
 from adk.config import DEFAULT_MODEL
@@ -38,9 +40,7 @@ def build_coordinator(agents: dict[str, LlmAgent]) -> LlmAgent:
     return coordinator
 
 
-def _build_coordinator_instruction(agent_roster: str) -> str:
-    """Build the coordinator's system instruction with agent roster."""
-    return f"""You are the **Coordinator** of the GeminiHydra AI Swarm.
+_COORD_INSTRUCTION_TEMPLATE = """You are the **Coordinator** of the GeminiHydra AI Swarm.
 
 ## Your Role
 Analyze user requests, break them into sub-tasks, and delegate to specialist agents.
@@ -68,9 +68,24 @@ For simple questions, answer directly. For complex tasks, delegate.
 """
 
 
+@lru_cache(maxsize=32)
+def _build_coordinator_instruction(agent_roster: str) -> str:
+    """Fill the instruction template with the agent roster.
+
+    Memoized — coordinator pool replicas and roster refreshes pass the
+    same roster string repeatedly.
+    """
+    return _COORD_INSTRUCTION_TEMPLATE.format(agent_roster=agent_roster)
+
+
 def _format_agent_roster(agents: dict[str, LlmAgent]) -> str:
     """Format agent descriptions as a Markdown list for the coordinator instruction."""
-    lines = []
-    for agent_id, agent in agents.items():
-        lines.append(f"- **{agent_id}**: {agent.description}")
+    return _format_roster_cached(
+        tuple((agent_id, agent.description) for agent_id, agent in agents.items())
+    )
+
+
+@lru_cache(maxsize=32)
+def _format_roster_cached(entries: tuple[tuple[str, str], ...]) -> str:
+    lines = [f"- **{agent_id}**: {description}" for agent_id, description in entries]
     return "\n".join(lines) if lines else "- No specialist agents available"
@@ -4,12 +4,65 @@ These patterns compose WitcherAgent LlmAgents into multi-agent workflows
 using ADK's built-in workflow agents.
 """
 
+import asyncio
+
 from google.adk.agents import LlmAgent, SequentialAgent, ParallelAgent, LoopAgent, BaseAgent
 from google.adk.events import Event, EventActions
 
 from adk.config import DEFAULT_MODEL
 
 
+# ---------------------------------------------------------------------------
+# State compaction — curb context growth between pipeline stages
+# ---------------------------------------------------------------------------
+
+_COMPACT_MAX_CHARS = 600
+
+
+class StateCompactor(BaseAgent):
+    """Compacts older agent outputs in session state before a handoff.
+
+    Every stage writes its full output under a '*_output' key and each
+    downstream agent sees all prior keys, so context (and token cost)
+    grows linearly with pipeline length. The compactor keeps the most
+    recent output verbatim and truncates older ones to head/tail
+    excerpts.
+    """
+
+    def __init__(self, name: str = "state_compactor"):
+        super().__init__(
+            name=name,
+            description="Compacts prior agent outputs to curb context growth",
+        )
+
+    async def _run_async_impl(self, ctx):
+        state = ctx.session.state
+        output_keys = [key for key in state if key.endswith("_output")]
+        compacted = 0
+        # The newest output (last written) is left intact for the next stage.
+        for key in output_keys[:-1]:
+            value = state[key]
+            if isinstance(value, str) and len(value) > _COMPACT_MAX_CHARS:
+                half = _COMPACT_MAX_CHARS // 2
+                state[key] = f"{value[:half]}\n[... compacted ...]\n{value[-half:]}"
+                compacted += 1
+
+        yield Event(
+            author=self.name,
+            actions=EventActions(),
+            content=f"Compacted {compacted} prior outputs",
+        )
+
+
+def _interleave_compactors(sub_agents: list) -> list:
+    """Insert a StateCompactor between consecutive pipeline stages."""
+    result = [sub_agents[0]]
+    for i, agent in enumerate(sub_agents[1:], start=1):
+        result.append(StateCompactor(name=f"state_compactor_{i}"))
+        result.append(agent)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Pattern 1: Sequential Pipeline — Code Review
 # ---------------------------------------------------------------------------
@@ -26,7 +79,7 @@ def build_code_review_pipeline(agents: dict[str, LlmAgent]) -> SequentialAgent:
     return SequentialAgent(
         name="code_review_pipeline",
         description="Full code review: analysis -> tests -> security -> documentation",
-        sub_agents=sub,
+        sub_agents=_interleave_compactors(sub),
     )
 
 
@@ -64,6 +117,8 @@ def build_analysis_pipeline(agents: dict[str, LlmAgent]) -> SequentialAgent:
         output_key="synthesis_output",
     )
 
+    # No compactor here: the parallel stage's outputs are concurrent peers
+    # the synthesizer must read in full, not stale history to truncate.
     return SequentialAgent(
         name="comprehensive_analysis",
         description="Parallel multi-perspective analysis followed by synthesis",
@@ -87,13 +142,16 @@ class QualityGate(BaseAgent):
         self._max_retries = max_retries
 
     async def _run_async_impl(self, ctx):
-        review_status = ctx.session.state.get("review_status", "needs_work")
-        iteration = ctx.session.state.get("iteration_count", 0)
-        ctx.session.state["iteration_count"] = iteration + 1
+        # One read and one write per iteration — the session state may be
+        # backed by a persistent store where each access is a round trip.
+        state = ctx.session.state
+        review_status = state.get("review_status", "needs_work")
+        iteration = state.get("iteration_count", 0) + 1
+        state["iteration_count"] = iteration
 
-        should_exit = review_status == "approved" or iteration >= self._max_retries
+        should_exit = review_status == "approved" or iteration > self._max_retries
 
-        status_msg = f"Quality gate: {review_status} (iteration {iteration + 1}/{self._max_retries + 1})"
+        status_msg = f"Quality gate: {review_status} (iteration {iteration}/{self._max_retries + 1})"
         if should_exit and review_status != "approved":
             status_msg += " — max iterations reached, accepting current state"
 
@@ -141,13 +199,18 @@ def build_refinement_loop(agents: dict[str, LlmAgent]) -> LoopAgent:
 # All preset orchestration pipelines
 # ---------------------------------------------------------------------------
 
-def build_all_pipelines(agents: dict[str, LlmAgent]) -> dict[str, SequentialAgent | LoopAgent]:
-    """Build all preset orchestration pipelines from available agents."""
-    return {
-        "sequential": build_code_review_pipeline(agents),
-        "parallel": build_analysis_pipeline(agents),
-        "loop": build_refinement_loop(agents),
-    }
+async def build_all_pipelines(agents: dict[str, LlmAgent]) -> dict[str, SequentialAgent | LoopAgent]:
+    """Build all preset orchestration pipelines from available agents.
+
+    The three builders are independent, so they run concurrently off the
+    event loop — assembly time is the max of the three, not the sum.
+    """
+    sequential, parallel, loop = await asyncio.gather(
+        asyncio.to_thread(build_code_review_pipeline, agents),
+        asyncio.to_thread(build_analysis_pipeline, agents),
+        asyncio.to_thread(build_refinement_loop, agents),
+    )
+    return {"sequential": sequential, "parallel": parallel, "loop": loop}
 
 
 def _pick_agents(agents: dict[str, LlmAgent], ids: list[str]) -> list[LlmAgent]:
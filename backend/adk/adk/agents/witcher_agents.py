@@ -4,66 +4,97 @@ Reads the gh_agents table at startup and creates one LlmAgent per active agent.
 Each agent gets the full set of bridge tools and a unique output_key for state passing.
 """
 
+import asyncio
+from functools import lru_cache
+
 import asyncpg
 from google.adk.agents import LlmAgent
 
 from adk.config import DEFAULT_MODEL
 from adk.tools.bridge import ALL_TOOLS
 
+_RULES_BLOCK = "\n".join([
+    "## Rules",
+    "- You run on a LOCAL Windows machine with FULL filesystem access.",
+    "- Use dedicated tools (list_directory, read_file, search_files, get_code_structure) for file operations.",
+    "- NEVER use execute_command for reading, listing, searching, or analyzing files.",
+    "- Call get_code_structure BEFORE read_file on source code files.",
+    "- Request MULTIPLE tool calls in PARALLEL when they are independent.",
+    "- Synthesize tool output into structured tables/lists.",
+    "- Stop after 3-5 tool calls and write your analysis.",
+])
+
+
+# Parameterized so asyncpg's per-connection statement cache reuses the
+# prepared plan across the periodic roster refreshes. Backed by the
+# gh_agents(status, created_at) composite index (migration 044).
+_AGENTS_SQL = (
+    "SELECT id, name, role, tier, status, description, system_prompt, "
+    "keywords, temperature, model_override "
+    "FROM gh_agents WHERE status = $1 ORDER BY created_at"
+)
+
 
 async def build_witcher_agents(pool: asyncpg.Pool) -> dict[str, LlmAgent]:
     """Load agents from gh_agents DB and build ADK LlmAgent instances.
 
+    LlmAgent construction is serial Python CPU; rows are built off the
+    event loop in parallel so startup and roster refresh don't block
+    request serving.
+
     Args:
         pool: asyncpg connection pool to the GeminiHydra database.
 
     Returns:
         Dictionary mapping agent_id -> LlmAgent instance.
     """
-    rows = await pool.fetch(
-        "SELECT id, name, role, tier, status, description, system_prompt, "
-        "keywords, temperature, model_override "
-        "FROM gh_agents WHERE status = 'online' ORDER BY created_at"
+    rows = await pool.fetch(_AGENTS_SQL, "online")
+    built = await asyncio.gather(
+        *(asyncio.to_thread(_build_one, row) for row in rows)
     )
+    return dict(built)
 
-    agents: dict[str, LlmAgent] = {}
-    for row in rows:
-        agent_id = row["id"]
-        instruction = _build_instruction(row)
-        model = row["model_override"] or DEFAULT_MODEL
-
-        agent = LlmAgent(
-            model=model,
-            name=agent_id,
-            description=f"{row['name']} ({row['role']}) — {row['description']}",
-            instruction=instruction,
-            tools=ALL_TOOLS,
-            output_key=f"{agent_id}_output",
-        )
-        agents[agent_id] = agent
 
-    return agents
+def _build_one(row: asyncpg.Record) -> tuple[str, LlmAgent]:
+    """Construct one (agent_id, LlmAgent) pair from a gh_agents row."""
+    agent_id = row["id"]
+    agent = LlmAgent(
+        model=row["model_override"] or DEFAULT_MODEL,
+        name=agent_id,
+        description=f"{row['name']} ({row['role']}) — {row['description']}",
+        instruction=_build_instruction(row),
+        tools=ALL_TOOLS,
+        output_key=f"{agent_id}_output",
+    )
+    return agent_id, agent
 
 
 def _build_instruction(row: asyncpg.Record) -> str:
-    """Build agent instruction from DB row fields."""
+    """Build agent instruction from DB row fields.
+
+    Memoized on the stable row fields — roster refresh and coordinator
+    pool replicas rebuild the same instructions repeatedly.
+    """
+    return _build_instruction_cached(
+        row["name"], row["role"], row["tier"],
+        row["description"], row["system_prompt"] or "",
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_instruction_cached(
+    name: str, role: str, tier: str, description: str, system_prompt: str
+) -> str:
     parts = [
-        f"You are **{row['name']}**, a {row['role']} specialist in the GeminiHydra AI Swarm.",
-        f"Tier: {row['tier']}.",
+        f"You are **{name}**, a {role} specialist in the GeminiHydra AI Swarm.",
+        f"Tier: {tier}.",
         "",
-        f"Your domain: {row['description']}",
+        f"Your domain: {description}",
         "",
-        "## Rules",
-        "- You run on a LOCAL Windows machine with FULL filesystem access.",
-        "- Use dedicated tools (list_directory, read_file, search_files, get_code_structure) for file operations.",
-        "- NEVER use execute_command for reading, listing, searching, or analyzing files.",
-        "- Call get_code_structure BEFORE read_file on source code files.",
-        "- Request MULTIPLE tool calls in PARALLEL when they are independent.",
-        "- Synthesize tool output into structured tables/lists.",
-        "- Stop after 3-5 tool calls and write your analysis.",
+        _RULES_BLOCK,
     ]
 
-    if row["system_prompt"]:
-        parts.extend(["", "## Agent-Specific Instructions", row["system_prompt"]])
+    if system_prompt:
+        parts.extend(["", "## Agent-Specific Instructions", system_prompt])
 
     return "\n".join(parts)
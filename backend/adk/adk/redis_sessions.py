@@ -0,0 +1,85 @@
+"""Redis-backed session persistence (optional, enabled via REDIS_URL).
+
+InMemorySessionService loses every session on restart, forcing clients
+to replay conversation history. RedisSessionService keeps the in-memory
+store as the hot path and write-throughs a serialized snapshot of the
+session after each appended event; a get_session miss restores the
+snapshot from Redis with one round trip, so reconnects and sidecar
+restarts never need a full replay.
+"""
+
+import logging
+
+import redis.asyncio as aioredis
+from google.adk.sessions import InMemorySessionService, Session
+
+logger = logging.getLogger("geminihydra-adk")
+
+SESSION_TTL_SEC = 7 * 24 * 3600
+
+
+class RedisSessionService(InMemorySessionService):
+    """In-memory session service with Redis write-through persistence."""
+
+    def __init__(self, url: str):
+        super().__init__()
+        self._redis = aioredis.from_url(url)
+
+    @staticmethod
+    def _key(app_name: str, user_id: str, session_id: str) -> str:
+        return f"adk:sess:{app_name}:{user_id}:{session_id}"
+
+    async def get_session(self, *, app_name, user_id, session_id, config=None):
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None:
+            return session
+        return await self._restore(app_name, user_id, session_id)
+
+    async def append_event(self, session, event):
+        result = await super().append_event(session, event)
+        await self._persist(session)
+        return result
+
+    async def delete_session(self, *, app_name, user_id, session_id):
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        try:
+            await self._redis.delete(self._key(app_name, user_id, session_id))
+        except Exception as e:
+            logger.debug(f"Redis session delete failed: {e}")
+
+    async def _persist(self, session) -> None:
+        try:
+            await self._redis.set(
+                self._key(session.app_name, session.user_id, session.id),
+                session.model_dump_json(),
+                ex=SESSION_TTL_SEC,
+            )
+        except Exception as e:
+            logger.debug(f"Redis session persist failed: {e}")
+
+    async def _restore(self, app_name: str, user_id: str, session_id: str):
+        """Rebuild an in-memory session from its Redis snapshot, if one exists."""
+        try:
+            raw = await self._redis.get(self._key(app_name, user_id, session_id))
+        except Exception as e:
+            logger.debug(f"Redis session restore failed: {e}")
+            return None
+        if raw is None:
+            return None
+
+        snapshot = Session.model_validate_json(raw)
+        restored = await super().create_session(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            state=dict(snapshot.state),
+        )
+        # Replay events through the in-memory store only — the snapshot in
+        # Redis is already current.
+        for event in snapshot.events:
+            await InMemorySessionService.append_event(self, restored, event)
+        return restored
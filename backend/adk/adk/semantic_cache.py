@@ -0,0 +1,97 @@
+"""Optional semantic cache for /run and /run_sse event streams.
+
+Near-duplicate prompts re-execute the entire agent graph today. When
+ADK_SEMANTIC_CACHE=1 the server embeds each user message via the Gemini
+embedding API, looks for a prior prompt with cosine similarity above the
+threshold scoped by (pattern, user_id), and replays that run's serialized
+events instead of re-running the pipeline.
+
+The index is a bounded in-memory store with LRU eviction; at the default
+size (128 entries) a brute-force cosine scan is cheaper than maintaining
+an ANN index.
+"""
+
+import logging
+import math
+import os
+from collections import OrderedDict
+
+import httpx
+
+from adk.config import GOOGLE_API_KEY
+
+logger = logging.getLogger("geminihydra-adk")
+
+ENABLED = os.environ.get("ADK_SEMANTIC_CACHE", "0") == "1"
+THRESHOLD = float(os.environ.get("ADK_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+MAX_ENTRIES = int(os.environ.get("ADK_SEMANTIC_CACHE_SIZE", "128"))
+
+_EMBED_URL = (
+    "https://generativelanguage.googleapis.com/v1beta/"
+    "models/text-embedding-004:embedContent"
+)
+
+
+class SemanticCache:
+    """Bounded in-memory semantic cache with LRU eviction.
+
+    Entries map an embedding vector to the serialized event chunks of a
+    completed run, namespaced by (pattern, user_id) so one user's cached
+    answers never leak into another's.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, threshold: float = THRESHOLD):
+        self._max_entries = max_entries
+        self._threshold = threshold
+        # entry_id -> (namespace, vector, chunks); insertion order = LRU order
+        self._entries: OrderedDict[int, tuple[tuple, list[float], list[bytes]]] = OrderedDict()
+        self._next_id = 0
+        self._client = httpx.AsyncClient(
+            headers={"x-goog-api-key": GOOGLE_API_KEY}, timeout=10.0
+        )
+
+    async def embed(self, text: str) -> list[float] | None:
+        """Embed message text; returns None (cache bypass) on any failure."""
+        if not GOOGLE_API_KEY:
+            return None
+        try:
+            resp = await self._client.post(
+                _EMBED_URL, json={"content": {"parts": [{"text": text}]}}
+            )
+            resp.raise_for_status()
+            return resp.json()["embedding"]["values"]
+        except Exception as e:
+            logger.debug(f"Semantic cache embed failed: {e}")
+            return None
+
+    def lookup(self, namespace: tuple, vector: list[float]) -> list[bytes] | None:
+        """Return the cached event chunks of the most similar prior prompt, if any."""
+        best_id = None
+        best_score = self._threshold
+        for entry_id, (ns, vec, _) in self._entries.items():
+            if ns != namespace:
+                continue
+            score = _cosine(vector, vec)
+            if score >= best_score:
+                best_id = entry_id
+                best_score = score
+        if best_id is None:
+            return None
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][2]
+
+    def store(self, namespace: tuple, vector: list[float], chunks: list[bytes]) -> None:
+        """Record a completed run's serialized events for future replay."""
+        self._entries[self._next_id] = (namespace, vector, chunks)
+        self._next_id += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    """Cosine similarity of two equal-length vectors."""
+    if len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
@@ -10,71 +10,254 @@ Starts the ADK API server with:
 import asyncio
 import logging
 import os
+import uuid
+from contextlib import asynccontextmanager
 
 import asyncpg
+import msgspec
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
+from google.genai import types
 
+from adk import semantic_cache, tasks
 from adk.agents.coordinator import build_coordinator
 from adk.agents.orchestration import build_all_pipelines
 from adk.agents.review_pipeline import build_review_pipeline, build_security_review
 from adk.agents.witcher_agents import build_witcher_agents
-from adk.config import DATABASE_URL, PORT
+from adk.config import (
+    ADK_WARMUP,
+    AGENT_REFRESH_SEC,
+    COORD_POOL_SIZE,
+    DATABASE_URL,
+    PORT,
+    REDIS_URL,
+)
+from adk.tools.bridge import begin_search_scope
 
 load_dotenv()
 logger = logging.getLogger("geminihydra-adk")
 
+class RunnerPool:
+    """Checkout pool of Runner instances.
+
+    LlmAgents maintain per-turn state and are not coroutine-safe, so
+    concurrent requests must never share one agent tree. Each request
+    checks a Runner out for the duration of its event stream; requests
+    beyond the pool size wait instead of racing.
+    """
+
+    def __init__(self, runners: list[Runner]):
+        self._queue: asyncio.Queue[Runner] = asyncio.Queue()
+        for runner in runners:
+            self._queue.put_nowait(runner)
+
+    async def acquire(self) -> Runner:
+        return await self._queue.get()
+
+    def release(self, runner: Runner) -> None:
+        self._queue.put_nowait(runner)
+
+
 # Global references set at startup
-_runner: Runner | None = None
 _session_service: InMemorySessionService | None = None
 _agents: dict[str, LlmAgent] = {}
 _pipelines: dict = {}
-
-app = FastAPI(title="GeminiHydra ADK Sidecar", version="1.0.0")
-
-
-@app.on_event("startup")
-async def startup():
-    """Load agents from DB and build coordinator + pipelines."""
-    global _runner, _session_service, _agents, _pipelines
+_coordinator_pool: RunnerPool | None = None
+_pattern_pools: dict[str, RunnerPool] = {}
+_pool: asyncpg.Pool | None = None
+_swap_lock = asyncio.Lock()
+_semantic_cache = semantic_cache.SemanticCache() if semantic_cache.ENABLED else None
+_task_store = tasks.TaskStore()
+# Strong references to in-flight background runs — the event loop only
+# holds weak references to tasks, so an unreferenced run can be
+# garbage-collected mid-execution.
+_background_runs: set[asyncio.Task] = set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load agents from DB and build coordinator + pipelines.
+
+    Independent startup steps run concurrently so cold-start time is the
+    max of the subtasks, not their sum.
+    """
+    global _session_service, _coordinator_pool, _pool
 
     logger.info("Connecting to PostgreSQL...")
+    pool_task = asyncio.create_task(
+        asyncpg.create_pool(DATABASE_URL, min_size=1, max_size=10)
+    )
+    # Session service init does not need the DB — do it while the pool connects.
+    _session_service = _make_session_service()
+
     try:
-        pool = await asyncpg.create_pool(DATABASE_URL, min_size=1, max_size=5)
+        _pool = await pool_task
     except Exception as e:
         logger.warning(f"DB connection failed ({e}), using standalone coordinator")
-        pool = None
+        _pool = None
 
-    if pool:
+    if _pool:
         logger.info("Loading WitcherAgents from gh_agents...")
-        _agents = await build_witcher_agents(pool)
-        logger.info(f"Loaded {len(_agents)} agents: {list(_agents.keys())}")
-        await pool.close()
+        agents = await build_witcher_agents(_pool)
+        logger.info(f"Loaded {len(agents)} agents: {list(agents.keys())}")
     else:
-        _agents = {}
-
-    if _agents:
-        coordinator = build_coordinator(_agents)
-        _pipelines = build_all_pipelines(_agents)
-        _pipelines["review"] = build_review_pipeline(_agents)
-        _pipelines["security"] = build_security_review(_agents)
-        logger.info(f"Built pipelines: {list(_pipelines.keys())}")
+        agents = {}
+
+    if agents:
+        await _rebuild_swarm(agents)
     else:
         from adk.agent import root_agent
-        coordinator = root_agent
+        _coordinator_pool = RunnerPool([
+            Runner(
+                agent=root_agent,
+                app_name="geminihydra",
+                session_service=_session_service,
+            )
+        ])
         logger.info("No DB agents found, using standalone coordinator")
 
-    _session_service = InMemorySessionService()
-    _runner = Runner(
-        agent=coordinator,
-        app_name="geminihydra",
-        session_service=_session_service,
-    )
     logger.info("ADK Runner initialized")
 
+    if ADK_WARMUP:
+        await _warmup_runners()
+
+    # The pool stays open: gh_agents is re-read periodically so agent edits
+    # go live without a sidecar restart.
+    refresh_task = asyncio.create_task(_refresh_loop()) if _pool else None
+
+    yield
+
+    if refresh_task:
+        refresh_task.cancel()
+    if _pool:
+        await _pool.close()
+        _pool = None
+
+
+async def _warmup_runners() -> None:
+    """Exercise each runner once so first real requests skip cold-path costs.
+
+    Analogous to JIT warmup: ADK's internal caches and lazy imports are
+    populated by a throwaway "ping" turn per pattern. Failures and
+    timeouts are swallowed — warmup must never block startup.
+    """
+    pools = dict(_pattern_pools)
+    if _coordinator_pool:
+        pools["hierarchical"] = _coordinator_pool
+
+    for name, pool in pools.items():
+        runner = await pool.acquire()
+        try:
+            await asyncio.wait_for(_warmup_one(runner, name), 5.0)
+            logger.info(f"Warmed up runner: {name}")
+        except Exception as e:
+            logger.debug(f"Warmup for {name} skipped: {e}")
+        finally:
+            pool.release(runner)
+
+
+async def _warmup_one(runner: Runner, name: str) -> None:
+    session_id = f"_warmup_{name}_{uuid.uuid4().hex[:8]}"
+    await _session_service.create_session(
+        app_name="geminihydra", user_id="_warmup", session_id=session_id
+    )
+    async for _ in runner.run_async(
+        user_id="_warmup",
+        session_id=session_id,
+        new_message=_make_user_content("ping"),
+    ):
+        pass
+
+
+def _make_session_service() -> InMemorySessionService:
+    """Pick the session backend: Redis-persisted when REDIS_URL is set."""
+    if REDIS_URL:
+        try:
+            from adk.redis_sessions import RedisSessionService
+            logger.info("Using Redis-backed session service")
+            return RedisSessionService(REDIS_URL)
+        except Exception as e:
+            logger.warning(f"Redis session service unavailable ({e}), using in-memory")
+    return InMemorySessionService()
+
+
+async def _rebuild_swarm(agents: dict[str, LlmAgent]) -> None:
+    """Build coordinator pool, pipelines, and runners; swap the globals atomically."""
+    global _agents, _pipelines, _coordinator_pool, _pattern_pools
+
+    # Coordinator and pipeline builders are independent of each other —
+    # assemble them concurrently off the event loop.
+    coordinator, pipelines, review, security = await asyncio.gather(
+        asyncio.to_thread(build_coordinator, agents),
+        build_all_pipelines(agents),
+        asyncio.to_thread(build_review_pipeline, agents),
+        asyncio.to_thread(build_security_review, agents),
+    )
+    pipelines["review"] = review
+    pipelines["security"] = security
+    logger.info(f"Built pipelines: {list(pipelines.keys())}")
+
+    # Coordinator replicas each get a freshly built agent roster — replicas
+    # must not share stateful LlmAgent instances with each other.
+    coordinators = [coordinator]
+    if _pool is not None and COORD_POOL_SIZE > 1:
+        rosters = await asyncio.gather(
+            *(build_witcher_agents(_pool) for _ in range(COORD_POOL_SIZE - 1))
+        )
+        coordinators += await asyncio.gather(
+            *(asyncio.to_thread(build_coordinator, roster) for roster in rosters)
+        )
+
+    coordinator_pool = RunnerPool([
+        Runner(
+            agent=coord,
+            app_name="geminihydra",
+            session_service=_session_service,
+        )
+        for coord in coordinators
+    ])
+    # One single-Runner pool per pattern: concurrent requests for the same
+    # pattern queue up instead of racing on shared pipeline state.
+    pattern_pools = {
+        name: RunnerPool([
+            Runner(
+                agent=pipeline,
+                app_name="geminihydra",
+                session_service=_session_service,
+            )
+        ])
+        for name, pipeline in pipelines.items()
+    }
+
+    async with _swap_lock:
+        _agents = agents
+        _pipelines = pipelines
+        _coordinator_pool = coordinator_pool
+        _pattern_pools = pattern_pools
+
+
+async def _refresh_loop():
+    """Periodically reload the agent roster from gh_agents and hot-swap it."""
+    while True:
+        await asyncio.sleep(AGENT_REFRESH_SEC)
+        try:
+            agents = await build_witcher_agents(_pool)
+            if agents:
+                await _rebuild_swarm(agents)
+                logger.info(f"Agent roster refreshed: {list(agents.keys())}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Agent refresh failed: {e}")
+
+
+app = FastAPI(title="GeminiHydra ADK Sidecar", version="1.0.0", lifespan=lifespan)
+
 
 @app.get("/list-apps")
 async def list_apps():
@@ -83,7 +266,7 @@ async def list_apps():
         "apps": ["geminihydra"],
         "agents": list(_agents.keys()),
         "pipelines": list(_pipelines.keys()),
-        "status": "ready" if _runner else "initializing",
+        "status": "ready" if _coordinator_pool else "initializing",
     }
 
 
@@ -95,17 +278,40 @@ async def health():
 
 @app.post("/run")
 async def run_agent(request: dict):
-    """Execute agent and return all events as JSON array."""
-    if not _runner or not _session_service:
+    """Execute agent and stream events as NDJSON (one JSON object per line).
+
+    Events are emitted as they arrive instead of being buffered into one
+    JSON array, so memory stays constant and the client sees the first
+    event before the pipeline finishes.
+    """
+    if not _coordinator_pool or not _session_service:
         return {"error": "ADK not initialized"}
 
     user_id = request.get("userId", "default")
-    session_id = request.get("sessionId", "default")
+    # Server-assigned continuation token: clients resume this session by
+    # echoing the id instead of replaying conversation history.
+    session_id = request.get("sessionId") or str(uuid.uuid4())
     message_text = _extract_message(request)
     pattern = request.get("config", {}).get("pattern")
 
-    # Select agent based on pattern
-    agent_runner = _get_runner_for_pattern(pattern)
+    # Select runner pool based on pattern
+    runner_pool = _get_pool_for_pattern(pattern)
+
+    # Optional semantic cache: replay a near-duplicate prompt's events
+    # without touching the agent graph.
+    cache_ns = (pattern or "hierarchical", user_id)
+    cache_vec = await _semantic_cache.embed(message_text) if _semantic_cache else None
+    if cache_vec is not None:
+        cached = _semantic_cache.lookup(cache_ns, cache_vec)
+        if cached is not None:
+            async def replay():
+                for chunk in cached:
+                    yield chunk + b"\n"
+            return StreamingResponse(
+                replay(),
+                media_type="application/x-ndjson",
+                headers=_session_headers(session_id),
+            )
 
     session = await _session_service.get_session(
         app_name="geminihydra", user_id=user_id, session_id=session_id
@@ -115,40 +321,58 @@ async def run_agent(request: dict):
             app_name="geminihydra", user_id=user_id, session_id=session_id
         )
 
-    from google.genai import types
-    user_content = types.Content(
-        role="user", parts=[types.Part.from_text(text=message_text)]
+    user_content = _make_user_content(message_text)
+    agent_runner = await runner_pool.acquire()
+
+    async def event_stream():
+        begin_search_scope(session_id)
+        chunks = []
+        try:
+            async for event in agent_runner.run_async(
+                user_id=user_id, session_id=session_id, new_message=user_content
+            ):
+                chunk = _encode_event(_serialize_event(event))
+                if cache_vec is not None:
+                    chunks.append(chunk)
+                yield chunk + b"\n"
+        finally:
+            runner_pool.release(agent_runner)
+        if cache_vec is not None:
+            _semantic_cache.store(cache_ns, cache_vec, chunks)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers=_session_headers(session_id),
     )
 
-    events = []
-    async for event in agent_runner.run_async(
-        user_id=user_id, session_id=session_id, new_message=user_content
-    ):
-        events.append({
-            "author": event.author if hasattr(event, "author") else "unknown",
-            "content": str(event.content) if hasattr(event, "content") else "",
-            "actions": str(event.actions) if hasattr(event, "actions") else None,
-        })
-
-    return {"events": events, "session_id": session_id}
-
 
 @app.post("/run_sse")
 async def run_agent_sse(request: dict):
     """Execute agent and stream events via SSE."""
     from sse_starlette.sse import EventSourceResponse
 
-    if not _runner or not _session_service:
+    if not _coordinator_pool or not _session_service:
         async def error_gen():
             yield {"data": '{"error": "ADK not initialized"}'}
         return EventSourceResponse(error_gen())
 
     user_id = request.get("userId", "default")
-    session_id = request.get("sessionId", "default")
+    session_id = request.get("sessionId") or str(uuid.uuid4())
     message_text = _extract_message(request)
     pattern = request.get("config", {}).get("pattern")
 
-    agent_runner = _get_runner_for_pattern(pattern)
+    runner_pool = _get_pool_for_pattern(pattern)
+
+    cache_ns = (pattern or "hierarchical", user_id)
+    cache_vec = await _semantic_cache.embed(message_text) if _semantic_cache else None
+    if cache_vec is not None:
+        cached = _semantic_cache.lookup(cache_ns, cache_vec)
+        if cached is not None:
+            async def replay():
+                for chunk in cached:
+                    yield {"data": chunk.decode()}
+            return EventSourceResponse(replay(), headers=_session_headers(session_id))
 
     session = await _session_service.get_session(
         app_name="geminihydra", user_id=user_id, session_id=session_id
@@ -158,79 +382,259 @@ async def run_agent_sse(request: dict):
             app_name="geminihydra", user_id=user_id, session_id=session_id
         )
 
-    from google.genai import types
-    import json
+    user_content = _make_user_content(message_text)
+    agent_runner = await runner_pool.acquire()
+
+    async def event_generator():
+        begin_search_scope(session_id)
+        chunks = []
+        try:
+            async for event in agent_runner.run_async(
+                user_id=user_id, session_id=session_id, new_message=user_content
+            ):
+                chunk = _encode_event(_serialize_event(event))
+                if cache_vec is not None:
+                    chunks.append(chunk)
+                yield {"data": chunk.decode()}
+        finally:
+            runner_pool.release(agent_runner)
+        if cache_vec is not None:
+            _semantic_cache.store(cache_ns, cache_vec, chunks)
+
+    return EventSourceResponse(
+        event_generator(), headers=_session_headers(session_id)
+    )
+
+
+@app.post("/tasks", status_code=202)
+async def submit_task(request: dict):
+    """Enqueue an agent run as a background task and return its id.
+
+    The HTTP connection is released immediately; clients poll
+    /tasks/{id} or subscribe to /tasks/{id}/stream for the events.
+    """
+    if not _coordinator_pool or not _session_service:
+        return {"error": "ADK not initialized"}
+
+    user_id = request.get("userId", "default")
+    session_id = request.get("sessionId") or str(uuid.uuid4())
+    message_text = _extract_message(request)
+    pattern = request.get("config", {}).get("pattern")
 
-    user_content = types.Content(
-        role="user", parts=[types.Part.from_text(text=message_text)]
+    task = _task_store.create()
+    runner = asyncio.create_task(
+        _run_task(task, user_id, session_id, message_text, pattern)
     )
+    _background_runs.add(runner)
+    runner.add_done_callback(_background_runs.discard)
+    return {"task_id": task.id, "status": task.status, "session_id": session_id}
+
+
+@app.get("/tasks/{task_id}")
+async def get_task(task_id: str, offset: int = 0):
+    """Poll task status and fetch events past `offset`."""
+    task = _task_store.get(task_id)
+    if not task:
+        return {"error": "unknown task", "task_id": task_id}
+
+    return {
+        "task_id": task.id,
+        "status": task.status,
+        "error": task.error,
+        "total_events": len(task.events),
+        "events": [orjson.loads(chunk) for chunk in task.events[offset:]],
+    }
+
+
+@app.get("/tasks/{task_id}/stream")
+async def stream_task(task_id: str):
+    """SSE stream of a task's events from the start, live until it finishes."""
+    from sse_starlette.sse import EventSourceResponse
+
+    task = _task_store.get(task_id)
+    if not task:
+        async def error_gen():
+            yield {"data": '{"error": "unknown task"}'}
+        return EventSourceResponse(error_gen())
 
     async def event_generator():
-        async for event in agent_runner.run_async(
-            user_id=user_id, session_id=session_id, new_message=user_content
-        ):
-            event_data = {
-                "author": event.author if hasattr(event, "author") else "unknown",
-                "timestamp": event.timestamp if hasattr(event, "timestamp") else None,
-            }
-
-            if hasattr(event, "content") and event.content:
-                content = event.content
-                if hasattr(content, "parts"):
-                    text_parts = []
-                    for part in content.parts:
-                        if hasattr(part, "text") and part.text:
-                            text_parts.append(part.text)
-                        elif hasattr(part, "function_call"):
-                            event_data["function_call"] = {
-                                "name": part.function_call.name,
-                                "args": dict(part.function_call.args) if part.function_call.args else {},
-                            }
-                        elif hasattr(part, "function_response"):
-                            event_data["function_response"] = {
-                                "name": part.function_response.name,
-                            }
-                    if text_parts:
-                        event_data["text"] = "\n".join(text_parts)
-
-                if hasattr(content, "role"):
-                    event_data["role"] = content.role
-
-            if hasattr(event, "actions") and event.actions:
-                actions = event.actions
-                if hasattr(actions, "escalate") and actions.escalate:
-                    event_data["escalate"] = True
-                if hasattr(actions, "transfer_to_agent") and actions.transfer_to_agent:
-                    event_data["transfer_to_agent"] = actions.transfer_to_agent
-
-            yield {"data": json.dumps(event_data)}
+        sent = 0
+        while True:
+            available = await task.wait_events(sent)
+            for chunk in task.events[sent:available]:
+                yield {"data": chunk.decode()}
+            sent = available
+            if task.status != "running" and sent >= len(task.events):
+                break
 
     return EventSourceResponse(event_generator())
 
 
-def _extract_message(request: dict) -> str:
-    """Extract user message text from ADK request format."""
-    new_message = request.get("newMessage", {})
-    parts = new_message.get("parts", [])
-    for part in parts:
-        if "text" in part:
-            return part["text"]
-    return request.get("prompt", "")
+async def _run_task(
+    task: tasks.Task,
+    user_id: str,
+    session_id: str,
+    message_text: str,
+    pattern: str | None,
+) -> None:
+    """Drive one background agent run, buffering events into the task."""
+    begin_search_scope(session_id)
+    runner_pool = _get_pool_for_pattern(pattern)
+    try:
+        session = await _session_service.get_session(
+            app_name="geminihydra", user_id=user_id, session_id=session_id
+        )
+        if not session:
+            session = await _session_service.create_session(
+                app_name="geminihydra", user_id=user_id, session_id=session_id
+            )
+
+        user_content = _make_user_content(message_text)
+        agent_runner = await runner_pool.acquire()
+        try:
+            async for event in agent_runner.run_async(
+                user_id=user_id, session_id=session_id, new_message=user_content
+            ):
+                await task.append(_encode_event(_serialize_event(event)))
+        finally:
+            runner_pool.release(agent_runner)
+        await task.finish()
+    except Exception as e:
+        logger.warning(f"Task {task.id} failed: {e}")
+        await task.finish(error=str(e))
 
 
-def _get_runner_for_pattern(pattern: str | None) -> Runner:
-    """Get the appropriate Runner for the orchestration pattern."""
-    global _runner, _session_service, _pipelines
+@app.get("/session/{session_id}/resume")
+async def resume_session(session_id: str, userId: str = "default"):
+    """Report whether a session can be continued server-side.
 
-    if not pattern or pattern == "hierarchical" or pattern not in _pipelines:
-        return _runner
+    Clients that reconnect check here instead of retransmitting the full
+    conversation; a resumable session only needs the new message.
+    """
+    if not _session_service:
+        return {"resumable": False, "session_id": session_id}
 
-    pipeline_agent = _pipelines[pattern]
-    return Runner(
-        agent=pipeline_agent,
-        app_name="geminihydra",
-        session_service=_session_service,
+    session = await _session_service.get_session(
+        app_name="geminihydra", user_id=userId, session_id=session_id
     )
+    if not session:
+        return {"resumable": False, "session_id": session_id}
+
+    return {
+        "resumable": True,
+        "session_id": session_id,
+        "events": len(getattr(session, "events", None) or []),
+        "last_update": getattr(session, "last_update_time", None),
+    }
+
+
+def _session_headers(session_id: str) -> dict:
+    """Continuation headers so clients can resume without replaying history."""
+    return {
+        "X-ADK-Session": session_id,
+        "Set-Cookie": f"adk_session={session_id}; Path=/; HttpOnly; SameSite=Lax",
+    }
+
+
+def _make_user_content(text: str) -> types.Content:
+    """Wrap user message text in the genai Content envelope."""
+    return types.Content(role="user", parts=[types.Part.from_text(text=text)])
+
+
+class EventOut(msgspec.Struct, omit_defaults=True):
+    """Wire shape of a streamed event.
+
+    A fixed-layout struct instead of a per-event dict: no key hashing on
+    construction, and msgspec.json.encode serializes it in one C call.
+    Fields left at their defaults are omitted from the payload.
+    """
+
+    author: str = "unknown"
+    timestamp: float | None = None
+    text: str | None = None
+    role: str | None = None
+    function_call: dict | None = None
+    function_response: dict | None = None
+    escalate: bool = False
+    transfer_to_agent: str | None = None
+
+
+_encode_event = msgspec.json.encode
+
+
+def _serialize_event(event) -> EventOut:
+    """Flatten an ADK event into an EventOut (shared by /run and /run_sse).
+
+    Hot path — one getattr with default per field instead of hasattr probing,
+    since this runs once per streamed event.
+    """
+    out = EventOut(
+        author=getattr(event, "author", "unknown"),
+        timestamp=getattr(event, "timestamp", None),
+    )
+
+    content = getattr(event, "content", None)
+    if content:
+        parts = getattr(content, "parts", None)
+        if parts:
+            text_parts = []
+            for part in parts:
+                text = getattr(part, "text", None)
+                if text:
+                    text_parts.append(text)
+                    continue
+                function_call = getattr(part, "function_call", None)
+                if function_call:
+                    out.function_call = {
+                        "name": function_call.name,
+                        "args": dict(function_call.args) if function_call.args else {},
+                    }
+                    continue
+                function_response = getattr(part, "function_response", None)
+                if function_response:
+                    out.function_response = {"name": function_response.name}
+            if text_parts:
+                out.text = "\n".join(text_parts)
+
+        out.role = getattr(content, "role", None)
+
+    actions = getattr(event, "actions", None)
+    if actions:
+        if getattr(actions, "escalate", None):
+            out.escalate = True
+        out.transfer_to_agent = getattr(actions, "transfer_to_agent", None)
+
+    return out
+
+
+def _extract_message(request: dict) -> str:
+    """Extract user message text from ADK request format.
+
+    Fast path: the protocol almost always sends a single text part, so
+    check parts[0] directly and only scan the rest when it isn't text.
+    """
+    new_message = request.get("newMessage")
+    if new_message:
+        parts = new_message.get("parts")
+        if parts:
+            first = parts[0]
+            text = first.get("text") if isinstance(first, dict) else None
+            if text is not None:
+                return text
+            for part in parts[1:]:
+                if "text" in part:
+                    return part["text"]
+    return request.get("prompt", "")
+
+
+def _get_pool_for_pattern(pattern: str | None) -> RunnerPool:
+    """Get the runner pool for the orchestration pattern.
+
+    Falls back to the hierarchical coordinator pool for unknown patterns.
+    """
+    if not pattern or pattern == "hierarchical":
+        return _coordinator_pool
+    return _pattern_pools.get(pattern, _coordinator_pool)
 
 
 def main():
@@ -0,0 +1,76 @@
+"""In-process background task store for long-running agent runs.
+
+Long pipelines (the refinement loop can run for minutes) should not tie
+up an HTTP connection. Tasks buffer their serialized events in process
+memory — same approach as the Rust backend's in-memory log ring buffer —
+so no extra queue infrastructure is needed; clients poll or stream the
+buffered events by task id.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+
+MAX_TASKS = 200
+
+
+class Task:
+    """A single background agent run and its buffered event stream."""
+
+    def __init__(self, task_id: str):
+        self.id = task_id
+        self.status = "running"
+        self.error: str | None = None
+        self.events: list[bytes] = []
+        self.created_at = time.time()
+        self._cond = asyncio.Condition()
+
+    async def append(self, chunk: bytes) -> None:
+        async with self._cond:
+            self.events.append(chunk)
+            self._cond.notify_all()
+
+    async def finish(self, error: str | None = None) -> None:
+        async with self._cond:
+            self.status = "error" if error else "done"
+            self.error = error
+            self._cond.notify_all()
+
+    async def wait_events(self, start: int) -> int:
+        """Block until events beyond `start` exist or the task ends.
+
+        Returns the new event count so the caller can drain events[start:].
+        """
+        async with self._cond:
+            await self._cond.wait_for(
+                lambda: len(self.events) > start or self.status != "running"
+            )
+            return len(self.events)
+
+
+class TaskStore:
+    """Bounded in-memory registry of background tasks.
+
+    When full, the oldest finished task is evicted; running tasks are
+    never dropped.
+    """
+
+    def __init__(self, max_tasks: int = MAX_TASKS):
+        self._max_tasks = max_tasks
+        self._tasks: OrderedDict[str, Task] = OrderedDict()
+
+    def create(self) -> Task:
+        task = Task(str(uuid.uuid4()))
+        self._tasks[task.id] = task
+        while len(self._tasks) > self._max_tasks:
+            for task_id, candidate in self._tasks.items():
+                if candidate.status != "running":
+                    del self._tasks[task_id]
+                    break
+            else:
+                break
+        return task
+
+    def get(self, task_id: str) -> Task | None:
+        return self._tasks.get(task_id)
@@ -5,20 +5,379 @@ ADK auto-generates tool schemas from these signatures.
 The Rust backend at POST /api/internal/tool handles actual execution.
 """
 
+import asyncio
+import atexit
+import contextvars
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
 import httpx
-from adk.config import RUST_BACKEND_URL, AUTH_SECRET
+from google.adk.tools import FunctionTool
+
+from adk.config import RUST_BACKEND_URL, AUTH_SECRET, BRIDGE_HTTP2, TOOL_CACHE_TTL_SEC
+
+# HTTP/2 multiplexes concurrent bridge calls over one TCP connection —
+# a gather of 50 reads uses 1 socket and 50 streams instead of 50
+# sockets. Cleartext h2 has no ALPN, so HTTP/1.1 is disabled when the
+# flag is on and hyper accepts the h2 preface directly (prior knowledge).
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = BRIDGE_HTTP2
+except ImportError:  # pragma: no cover
+    _HTTP2 = False
+
+# orjson (C, SIMD UTF-8) cuts encode/decode CPU by ~10x on the large
+# payloads read_file/search_files move; fall back to stdlib json so
+# deployments without the wheel keep working.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# When the backend is on the same host, a Unix domain socket skips the
+# TCP/IP stack entirely (checksums, window management) — start the Rust
+# backend with UDS_PATH=/path/to/ghydra.sock and set
+# RUST_BACKEND_URL=unix:///path/to/ghydra.sock to opt in. Plain TCP URLs
+# are untouched.
+_UDS_PATH = ""
+if RUST_BACKEND_URL.startswith("unix://"):
+    _UDS_PATH = RUST_BACKEND_URL[len("unix://"):]
+_BASE_URL = "http://localhost" if _UDS_PATH else RUST_BACKEND_URL
 
 _headers = {"Content-Type": "application/json"}
 if AUTH_SECRET:
     _headers["Authorization"] = f"Bearer {AUTH_SECRET}"
 
+# read_file/search_files responses are large JSON bodies; the Rust
+# CompressionLayer shrinks source text 3-10x on the wire when we
+# advertise it. zstd only when the decoder wheel is installed — httpx
+# can't decode what it didn't negotiate.
+try:
+    import zstandard  # noqa: F401
+
+    _headers["Accept-Encoding"] = "zstd, gzip"
+except ImportError:  # pragma: no cover
+    _headers["Accept-Encoding"] = "gzip"
+
+# Frozen request template: httpx skips URL parsing for pre-built URL
+# objects and header normalization for Headers instances, shaving
+# per-call Python overhead that compounds at high call rates.
+_FROZEN_HEADERS = httpx.Headers(_headers)
+_TOOL_URL = httpx.URL(_BASE_URL).join("/api/internal/tool")
+_TOOL_BATCH_URL = httpx.URL(_BASE_URL).join("/api/internal/tool/batch")
+_FILE_URL = httpx.URL(_BASE_URL).join("/api/internal/file")
+_MULTI_READ_URL = httpx.URL(_BASE_URL).join("/api/internal/tool/multi_read")
+
+# One long-lived client per process: keep-alive connections skip the
+# TCP (+TLS) handshake on every bridge call after the first.
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Lazily create the shared keep-alive client."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    base_url=_BASE_URL,
+                    timeout=60.0,
+                    headers=_FROZEN_HEADERS,
+                    http1=not _HTTP2,
+                    http2=_HTTP2,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32,
+                        max_connections=64,
+                        keepalive_expiry=60.0,
+                    ),
+                    # Explicit transports bypass the client-level flags.
+                    transport=httpx.HTTPTransport(
+                        retries=1,
+                        http1=not _HTTP2,
+                        http2=_HTTP2,
+                        uds=_UDS_PATH or None,
+                    ),
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+# Pre-built request envelopes, one per tool: the tool name is a constant
+# per bridge function, so the hot path concatenates bytes instead of
+# allocating a fresh {"name": ..., "args": ...} wrapper dict per call.
+_TOOL_NAMES = (
+    "list_directory", "read_file", "read_file_section", "search_files",
+    "find_file", "get_code_structure", "write_file", "edit_file",
+    "diff_files", "execute_command",
+)
+_ENVELOPE_PREFIX = {
+    name: b'{"name":"' + name.encode() + b'","args":' for name in _TOOL_NAMES
+}
+
+
+def _tool_body(name: str, args: dict) -> bytes:
+    """Serialize a tool call, using the pre-built envelope when available."""
+    prefix = _ENVELOPE_PREFIX.get(name)
+    if prefix is not None:
+        return prefix + _json_dumps(args) + b"}"
+    return _json_dumps({"name": name, "args": args})
+
+
+def _fast_decode(resp: httpx.Response) -> dict:
+    """Decode a tool response, skipping status machinery on the common 200.
+
+    raise_for_status allocates a status object and formats an error message
+    path even on success; checking the integer code directly saves that on
+    every bridge call.
+    """
+    if resp.status_code == 200:
+        return _json_loads(resp.content)
+    resp.raise_for_status()
+    return _json_loads(resp.content)
+
 
 def _call_tool(name: str, args: dict) -> dict:
     """Call Rust backend tool endpoint synchronously."""
-    with httpx.Client(base_url=RUST_BACKEND_URL, timeout=60.0, headers=_headers) as client:
-        resp = client.post("/api/internal/tool", json={"name": name, "args": args})
-        resp.raise_for_status()
-        return resp.json()
+    return _fast_decode(_get_client().post(_TOOL_URL, content=_tool_body(name, args)))
+
+
+# AsyncClients must not be shared across event loops — keep one per loop.
+_ACLIENTS: dict["asyncio.AbstractEventLoop", httpx.AsyncClient] = {}
+
+
+def _get_aclient() -> httpx.AsyncClient:
+    """Get (or create) the shared AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ACLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=_BASE_URL,
+            timeout=60.0,
+            headers=_FROZEN_HEADERS,
+            http1=not _HTTP2,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+            transport=httpx.AsyncHTTPTransport(
+                http1=not _HTTP2, http2=_HTTP2, uds=_UDS_PATH or None
+            ),
+        )
+        _ACLIENTS[loop] = client
+    return client
+
+
+async def _acall_tool(name: str, args: dict) -> dict:
+    """Call Rust backend tool endpoint without blocking the event loop.
+
+    Calls issued within the coalescing window are merged into a single
+    batch round-trip; independent tool calls can still be fanned out with
+    asyncio.gather and share the per-loop connection pool.
+    """
+    return await _get_batcher().call(name, args)
+
+
+def call_tools_batch(calls: list[dict]) -> list[dict]:
+    """Execute several tools in one HTTP round-trip.
+
+    Args:
+        calls: List of {"name": tool_name, "args": {...}} dicts.
+
+    Returns:
+        List of result dicts in the same order as the calls.
+    """
+    resp = _get_client().post(
+        _TOOL_BATCH_URL, content=_json_dumps({"calls": calls})
+    )
+    return _fast_decode(resp)["results"]
+
+
+async def acall_tools_batch(calls: list[dict]) -> list[dict]:
+    """Async variant of call_tools_batch."""
+    resp = await _get_aclient().post(
+        _TOOL_BATCH_URL, content=_json_dumps({"calls": calls})
+    )
+    return _fast_decode(resp)["results"]
+
+
+def read_files(paths: list[str]) -> dict[str, dict]:
+    """Read several files in one round-trip.
+
+    Disk reads run concurrently on the Rust side, so reading ten small
+    related files costs roughly one round-trip instead of ten.
+
+    Args:
+        paths: Absolute paths of the files to read.
+
+    Returns:
+        Dict mapping each path to its read_file-shaped result dict.
+    """
+    resp = _get_client().post(_MULTI_READ_URL, content=_json_dumps({"paths": paths}))
+    return _fast_decode(resp)["files"]
+
+
+async def aread_files(paths: list[str]) -> dict[str, dict]:
+    """Async variant of read_files."""
+    resp = await _get_aclient().post(
+        _MULTI_READ_URL, content=_json_dumps({"paths": paths})
+    )
+    return _fast_decode(resp)["files"]
+
+
+class BatchingProxy:
+    """Coalesces async tool calls issued within a short window into one batch.
+
+    Agents often emit several independent reads in the same step; instead
+    of N POSTs, calls arriving within `window_ms` are flushed together to
+    /api/internal/tool/batch and their futures resolved from the result
+    list.
+    """
+
+    def __init__(self, window_ms: float = 5.0):
+        self._window = window_ms / 1000.0
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def call(self, name: str, args: dict) -> dict:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append(({"name": name, "args": args}, future))
+        if len(self._pending) == 1:
+            # First call of a new window: schedule its flush. Each window
+            # gets its own task — a call arriving while an earlier flush's
+            # HTTP round-trip is still in flight would otherwise be
+            # stranded with no task left to resolve its future. The set
+            # keeps a strong reference until the task finishes.
+            task = loop.create_task(self._flush_after_window())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self._window)
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if len(pending) == 1:
+            # No coalescing happened — skip the batch envelope.
+            call, future = pending[0]
+            try:
+                resp = await _get_aclient().post(
+                    _TOOL_URL,
+                    content=_tool_body(call["name"], call["args"]),
+                )
+                result = _fast_decode(resp)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            if not future.done():
+                future.set_result(result)
+            return
+        try:
+            results = await acall_tools_batch([call for call, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# One coalescer per event loop, mirroring the AsyncClient lifecycle.
+_BATCHERS: dict["asyncio.AbstractEventLoop", BatchingProxy] = {}
+
+
+def _get_batcher() -> BatchingProxy:
+    loop = asyncio.get_running_loop()
+    batcher = _BATCHERS.get(loop)
+    if batcher is None:
+        batcher = BatchingProxy()
+        _BATCHERS[loop] = batcher
+    return batcher
+
+
+class _ToolCache:
+    """Bounded TTL+LRU cache for idempotent read-only tool results.
+
+    Agents re-request the same files repeatedly while reasoning; a short
+    TTL short-circuits those repeats with a dict lookup instead of an
+    HTTP round-trip plus a disk read on the Rust side. Write tools clear
+    the cache before posting so stale reads never outlive a mutation.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = TOOL_CACHE_TTL_SEC):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_READ_CACHE = _ToolCache()
+
+
+def _cache_key(name: str, args: dict) -> tuple:
+    return (name, tuple(sorted(args.items())))
+
+
+def _call_tool_cached(name: str, args: dict) -> dict:
+    """_call_tool with a TTL cache in front — read-only tools only."""
+    key = _cache_key(name, args)
+    hit = _READ_CACHE.get(key)
+    if hit is not None:
+        return hit
+    result = _call_tool(name, args)
+    if result.get("status") == "success":
+        _READ_CACHE.put(key, result)
+    return result
+
+
+async def _acall_tool_cached(name: str, args: dict) -> dict:
+    """_acall_tool with a TTL cache in front — read-only tools only."""
+    key = _cache_key(name, args)
+    hit = _READ_CACHE.get(key)
+    if hit is not None:
+        return hit
+    result = await _acall_tool(name, args)
+    if result.get("status") == "success":
+        _READ_CACHE.put(key, result)
+    return result
 
 
 def list_directory(path: str, show_hidden: bool = False) -> dict:
@@ -31,7 +390,7 @@ def list_directory(path: str, show_hidden: bool = False) -> dict:
     Returns:
         dict with status and directory listing including file sizes and line counts.
     """
-    return _call_tool("list_directory", {"path": path, "show_hidden": show_hidden})
+    return _call_tool_cached("list_directory", {"path": path, "show_hidden": show_hidden})
 
 
 def read_file(path: str) -> dict:
@@ -43,7 +402,113 @@ def read_file(path: str) -> dict:
     Returns:
         dict with status and file contents as text.
     """
-    return _call_tool("read_file", {"path": path})
+    key = _cache_key("read_file", {"path": path})
+    hit = _READ_CACHE.get(key)
+    if hit is not None:
+        return hit
+    resp = _get_client().get(
+        _FILE_URL, params={"path": path}, headers=_etag_headers(path)
+    )
+    replay = _etag_replay(path, resp)
+    if replay is not None:
+        _READ_CACHE.put(key, replay)
+        return replay
+    resp.raise_for_status()
+    result = _raw_file_result(resp)
+    if result["status"] == "success":
+        _READ_CACHE.put(key, result)
+        _etag_store(path, resp, result)
+    return result
+
+
+# ETag memory for read_file, keyed by path. Unlike the TTL cache this is
+# NOT cleared on writes — the server revalidates mtime+size on every
+# request, so a 304 is always safe to replay and an edited file simply
+# misses. Bounded LRU so long sessions don't grow it unboundedly.
+_ETAGS: "OrderedDict[str, tuple[str, dict]]" = OrderedDict()
+_ETAGS_MAX = 256
+_ETAGS_LOCK = threading.Lock()
+
+
+def _etag_headers(path: str) -> dict | None:
+    """If-None-Match header for a path with a known ETag, else None."""
+    with _ETAGS_LOCK:
+        cached = _ETAGS.get(path)
+        if cached is None:
+            return None
+        _ETAGS.move_to_end(path)
+        return {"If-None-Match": cached[0]}
+
+
+def _etag_replay(path: str, resp: httpx.Response) -> dict | None:
+    """Return the remembered result when the server answered 304."""
+    if resp.status_code != 304:
+        return None
+    with _ETAGS_LOCK:
+        cached = _ETAGS.get(path)
+    return cached[1] if cached is not None else None
+
+
+def _etag_store(path: str, resp: httpx.Response, result: dict) -> None:
+    """Remember the ETag + body for future conditional requests."""
+    etag = resp.headers.get("etag")
+    if not etag:
+        return
+    with _ETAGS_LOCK:
+        _ETAGS[path] = (etag, result)
+        _ETAGS.move_to_end(path)
+        while len(_ETAGS) > _ETAGS_MAX:
+            _ETAGS.popitem(last=False)
+
+
+def _raw_file_result(resp: httpx.Response) -> dict:
+    """Build the read_file result dict from a raw-bytes file response.
+
+    /api/internal/file serves file contents as application/octet-stream
+    with status and line count in headers — no JSON escaping of the body
+    on the Rust side, no unescaping here.
+    """
+    status = resp.headers.get("x-status", "error")
+    text = resp.content.decode("utf-8", errors="replace")
+    # The raw endpoint reports truncation only in a header; append the
+    # same marker the JSON tool path uses so the model never mistakes a
+    # capped file for a complete one (the TTL/ETag caches replay this
+    # result verbatim).
+    if resp.headers.get("x-truncated") == "true":
+        text += "\n... [file truncated]"
+    result: dict = {
+        "status": status,
+        "result": text,
+    }
+    if "x-line-count" in resp.headers:
+        result["line_count"] = int(resp.headers["x-line-count"])
+    return result
+
+
+def read_file_streaming(path: str) -> dict:
+    """Read a file, parsing the response incrementally instead of buffering.
+
+    For multi-MB sources, resp.json() holds the raw body and the decoded
+    string in memory at once and blocks for the whole parse. Streaming the
+    body through ijson keeps only one chunk buffered at a time. Falls back
+    to the buffered read_file when ijson is not installed.
+
+    Args:
+        path: Absolute path to the file.
+
+    Returns:
+        dict with status and file contents as text (same shape as read_file).
+    """
+    try:
+        import ijson
+    except ImportError:  # pragma: no cover
+        return read_file(path)
+
+    body = _tool_body("read_file", {"path": path})
+    with _get_client().stream("POST", _TOOL_URL, content=body) as resp:
+        resp.raise_for_status()
+        # ijson accepts an iterable of bytes; kvitems("") walks top-level keys.
+        return dict(ijson.kvitems(resp.iter_bytes(), ""))
 
 
 def read_file_section(path: str, start_line: int, end_line: int) -> dict:
@@ -57,13 +522,51 @@ def read_file_section(path: str, start_line: int, end_line: int) -> dict:
     Returns:
         dict with status and the requested line range.
     """
-    return _call_tool("read_file_section", {
+    return _call_tool_cached("read_file_section", {
         "path": path, "start_line": start_line, "end_line": end_line
     })
 
 
+# search_files limit auto-tuning: an EWMA of observed ms-per-result picks
+# a limit that keeps each call near the latency target — small enough to
+# respond fast, large enough to avoid paged follow-up calls.
+_SEARCH_TARGET_MS = 250.0
+_SEARCH_EWMA_ALPHA = 0.3
+_SEARCH_LOCK = threading.Lock()
+_search_ms_per_result = 0.0
+
+
+def _adaptive_search_limit() -> int:
+    """Pick a search limit targeting _SEARCH_TARGET_MS per call."""
+    with _SEARCH_LOCK:
+        if _search_ms_per_result <= 0:
+            return 80
+        return max(20, min(150, int(_SEARCH_TARGET_MS / _search_ms_per_result)))
+
+
+def _record_search_sample(elapsed_ms: float, limit: int) -> None:
+    """Fold one observed call into the ms-per-result EWMA."""
+    global _search_ms_per_result
+    per_result = elapsed_ms / max(limit, 1)
+    with _SEARCH_LOCK:
+        if _search_ms_per_result <= 0:
+            _search_ms_per_result = per_result
+        else:
+            _search_ms_per_result = (
+                _SEARCH_EWMA_ALPHA * per_result
+                + (1 - _SEARCH_EWMA_ALPHA) * _search_ms_per_result
+            )
+
+
+# No client-side regex pre-validation: the server's regex crate and
+# stdlib re diverge in both directions (\p{...} classes, (?<name>...)
+# groups), so a pattern stdlib rejects may be perfectly valid
+# server-side. The server reports genuinely invalid patterns as a
+# normal {"status": "error"} dict the model can read and correct.
+
+
 def search_files(path: str, pattern: str, file_extensions: str = "",
-                 offset: int = 0, limit: int = 80, multiline: bool = False) -> dict:
+                 offset: int = 0, limit: int = 0, multiline: bool = False) -> dict:
     """Search for text or regex patterns across all files in a directory recursively.
 
     Args:
@@ -71,17 +574,44 @@ def search_files(path: str, pattern: str, file_extensions: str = "",
         pattern: Regex pattern to search for.
         file_extensions: Comma-separated file extensions to filter (e.g. "rs,ts,py"). Empty = all text files.
         offset: Number of results to skip (pagination).
-        limit: Maximum number of results to return (default 80, max 150).
+        limit: Maximum number of results to return (max 150). 0 = auto-tuned from observed latency.
         multiline: Whether to enable multiline regex matching.
 
     Returns:
         dict with status and matching file locations with context.
     """
+    if limit <= 0:
+        limit = _adaptive_search_limit()
     args: dict = {"path": path, "pattern": pattern, "offset": offset,
                   "limit": limit, "multiline": multiline}
     if file_extensions:
         args["file_extensions"] = file_extensions
-    return _call_tool("search_files", args)
+    started = time.perf_counter()
+    result = _call_tool("search_files", args)
+    _record_search_sample((time.perf_counter() - started) * 1000.0, limit)
+    return result
+
+
+def search_files_many(path: str, patterns: list[str], file_extensions: str = "",
+                      limit: int = 0, multiline: bool = False) -> dict:
+    """Search for several patterns in one pass over the tree.
+
+    Merges the patterns into a single alternation (?:p1)|(?:p2)|... so the
+    directory is walked once instead of once per pattern.
+
+    Args:
+        path: Root directory to search in.
+        patterns: Regex patterns; matches for all of them are combined.
+        file_extensions: Comma-separated file extensions to filter. Empty = all text files.
+        limit: Maximum number of results to return (max 150). 0 = auto-tuned.
+        multiline: Whether to enable multiline regex matching.
+
+    Returns:
+        dict with status and combined matching file locations with context.
+    """
+    merged = "|".join(f"(?:{p})" for p in patterns)
+    return search_files(path, merged, file_extensions=file_extensions,
+                        limit=limit, multiline=multiline)
 
 
 def find_file(path: str, pattern: str) -> dict:
@@ -94,7 +624,7 @@ def find_file(path: str, pattern: str) -> dict:
     Returns:
         dict with status and list of matching file paths.
     """
-    return _call_tool("find_file", {"path": path, "pattern": pattern})
+    return _call_tool_cached("find_file", {"path": path, "pattern": pattern})
 
 
 def get_code_structure(path: str) -> dict:
@@ -110,7 +640,7 @@ def get_code_structure(path: str) -> dict:
     Returns:
         dict with status and extracted code symbols with line numbers.
     """
-    return _call_tool("get_code_structure", {"path": path})
+    return _call_tool_cached("get_code_structure", {"path": path})
 
 
 def write_file(path: str, content: str) -> dict:
@@ -123,9 +653,52 @@ def write_file(path: str, content: str) -> dict:
     Returns:
         dict with status confirming the write operation.
     """
+    if len(content) > _STREAM_THRESHOLD:
+        return write_file_streaming(path, content)
+    _READ_CACHE.clear()
     return _call_tool("write_file", {"path": path, "content": content})
 
 
+# Writes above this size skip the JSON tool envelope (which holds the
+# original, the escaped copy, and the send buffer in memory at once) and
+# stream raw chunks to the dedicated endpoint instead.
+_STREAM_THRESHOLD = 256 * 1024
+_STREAM_CHUNK = 64 * 1024
+
+
+def _iter_chunks(data: bytes):
+    view = memoryview(data)
+    for i in range(0, len(view), _STREAM_CHUNK):
+        yield bytes(view[i : i + _STREAM_CHUNK])
+
+
+def write_file_streaming(path: str, content: str) -> dict:
+    """Create or overwrite a file via chunked streaming upload.
+
+    Sends the content as raw 64 KB chunks to /api/internal/file, where the
+    Rust side writes them straight to disk — no JSON escaping and flat peak
+    memory on both ends. write_file routes here automatically for content
+    above 256 KB.
+
+    Args:
+        path: Absolute path for the file to write.
+        content: The full text content to write to the file.
+
+    Returns:
+        dict with status confirming the write operation.
+    """
+    _READ_CACHE.clear()
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    resp = _get_client().post(
+        _FILE_URL,
+        params={"path": path},
+        content=_iter_chunks(data),
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    resp.raise_for_status()
+    return _json_loads(resp.content)
+
+
 def edit_file(path: str, old_text: str, new_text: str) -> dict:
     """Make a targeted text replacement in an existing file.
 
@@ -140,9 +713,42 @@ def edit_file(path: str, old_text: str, new_text: str) -> dict:
     Returns:
         dict with status confirming the edit.
     """
+    _READ_CACHE.clear()
     return _call_tool("edit_file", {"path": path, "old_text": old_text, "new_text": new_text})
 
 
+def anchor_hash(text: str) -> str:
+    """blake2b-128 hex digest used as the anchor for edit_file_anchored."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def edit_file_anchored(path: str, start_line: int, end_line: int,
+                       old_hash: str, new_text: str) -> dict:
+    """Replace a line range identified by its hash instead of the full old text.
+
+    Cheaper than edit_file for large blocks: only a 32-char hash plus the
+    new text travels over the wire, and the hash check detects when the
+    file changed since it was read. read_file_section reports the range's
+    block_hash in its header — pass that value as old_hash.
+
+    Args:
+        path: Absolute path to the file to edit.
+        start_line: First line of the range to replace (1-indexed, inclusive).
+        end_line: Last line of the range to replace (1-indexed, inclusive).
+        old_hash: block_hash of the current range, as reported by read_file_section.
+        new_text: The replacement text for the range.
+
+    Returns:
+        dict with status confirming the edit, or an anchor-mismatch error
+        if the file changed — re-read the section and retry.
+    """
+    _READ_CACHE.clear()
+    return _call_tool("edit_file_anchored", {
+        "path": path, "start_line": start_line, "end_line": end_line,
+        "old_hash": old_hash, "new_text": new_text,
+    })
+
+
 def diff_files(path_a: str, path_b: str) -> dict:
     """Compare two files and show line-by-line differences.
 
@@ -153,7 +759,7 @@ def diff_files(path_a: str, path_b: str) -> dict:
     Returns:
         dict with status and unified diff output.
     """
-    return _call_tool("diff_files", {"path_a": path_a, "path_b": path_b})
+    return _call_tool_cached("diff_files", {"path_a": path_a, "path_b": path_b})
 
 
 def execute_command(command: str, working_directory: str = "") -> dict:
@@ -173,19 +779,259 @@ def execute_command(command: str, working_directory: str = "") -> dict:
     args: dict = {"command": command}
     if working_directory:
         args["working_directory"] = working_directory
+    _READ_CACHE.clear()
     return _call_tool("execute_command", args)
 
 
+# ---------------------------------------------------------------------------
+# Async variants — same tools, non-blocking. Registered with async-capable
+# agents so independent calls fan out through one connection pool.
+# ---------------------------------------------------------------------------
+
+
+async def alist_directory(path: str, show_hidden: bool = False) -> dict:
+    """List files and subdirectories in a local directory (async variant of list_directory)."""
+    return await _acall_tool_cached("list_directory", {"path": path, "show_hidden": show_hidden})
+
+
+async def aread_file(path: str) -> dict:
+    """Read the full contents of a local file (async variant of read_file)."""
+    key = _cache_key("read_file", {"path": path})
+    hit = _READ_CACHE.get(key)
+    if hit is not None:
+        return hit
+    resp = await _get_aclient().get(
+        _FILE_URL, params={"path": path}, headers=_etag_headers(path)
+    )
+    replay = _etag_replay(path, resp)
+    if replay is not None:
+        _READ_CACHE.put(key, replay)
+        return replay
+    resp.raise_for_status()
+    result = _raw_file_result(resp)
+    if result["status"] == "success":
+        _READ_CACHE.put(key, result)
+        _etag_store(path, resp, result)
+    return result
+
+
+async def aread_file_section(path: str, start_line: int, end_line: int) -> dict:
+    """Read a 1-indexed line range from a file (async variant of read_file_section)."""
+    return await _acall_tool_cached("read_file_section", {
+        "path": path, "start_line": start_line, "end_line": end_line
+    })
+
+
+# Agents routinely refine a search in a later turn before the previous
+# one finishes; the superseded request keeps burning CPU on the Rust
+# side otherwise. In-flight searches are tracked per (session, root
+# path) together with the logical turn they belong to: within one
+# session, a search from a *newer* turn cancels its predecessor (closing
+# the connection makes hyper drop the handler future, stopping the
+# walker server-side). Parallel searches within the same turn never
+# cancel each other, and concurrent runs of *different* sessions never
+# interfere — they hold different keys.
+_SEARCH_SCOPE: contextvars.ContextVar[tuple[str, object] | None] = (
+    contextvars.ContextVar("bridge_search_scope", default=None)
+)
+_INFLIGHT_SEARCHES: dict[tuple[str | None, str], tuple[object | None, asyncio.Task]] = {}
+
+
+def begin_search_scope(session_id: str) -> None:
+    """Mark the start of a logical agent turn for search supersession.
+
+    The server calls this at the top of each run; the session id plus a
+    fresh turn token are inherited by every tool call the run fans out,
+    so concurrent same-turn searches coexist and only a later turn of
+    the *same session* cancels a stale one.
+    """
+    _SEARCH_SCOPE.set((session_id, object()))
+
+
+async def _asearch_request(args: dict) -> dict:
+    """Issue a search directly (not via the batcher) so cancellation
+    reaches the underlying HTTP request."""
+    resp = await _get_aclient().post(
+        _TOOL_URL, content=_tool_body("search_files", args)
+    )
+    return _fast_decode(resp)
+
+
+async def asearch_files(path: str, pattern: str, file_extensions: str = "",
+                        offset: int = 0, limit: int = 0, multiline: bool = False) -> dict:
+    """Search for text or regex patterns across files (async variant of search_files)."""
+    if limit <= 0:
+        limit = _adaptive_search_limit()
+    args: dict = {"path": path, "pattern": pattern, "offset": offset,
+                  "limit": limit, "multiline": multiline}
+    if file_extensions:
+        args["file_extensions"] = file_extensions
+
+    scope = _SEARCH_SCOPE.get()
+    session, turn = scope if scope is not None else (None, None)
+    key = (session, path)
+    prev = _INFLIGHT_SEARCHES.get(key)
+    if prev is not None:
+        prev_turn, prev_task = prev
+        # Only supersede within a known session; calls outside any scope
+        # (session is None) never cancel each other.
+        if session is not None and prev_turn is not turn and not prev_task.done():
+            prev_task.cancel()
+    task = asyncio.get_running_loop().create_task(_asearch_request(args))
+    _INFLIGHT_SEARCHES[key] = (turn, task)
+
+    started = time.perf_counter()
+    try:
+        result = await task
+    except asyncio.CancelledError:
+        # Superseded by a newer turn: report it as a normal tool result —
+        # letting CancelledError escape would tear down the caller's
+        # whole gather. If the *awaiter* was cancelled instead, the task
+        # is still running and the cancellation must propagate.
+        if not task.cancelled():
+            raise
+        return {
+            "status": "cancelled",
+            "result": f"Search of {path} superseded by a newer search",
+        }
+    finally:
+        if _INFLIGHT_SEARCHES.get(key) == (turn, task):
+            del _INFLIGHT_SEARCHES[key]
+    _record_search_sample((time.perf_counter() - started) * 1000.0, limit)
+    return result
+
+
+async def afind_file(path: str, pattern: str) -> dict:
+    """Find files by glob-style name pattern (async variant of find_file)."""
+    return await _acall_tool_cached("find_file", {"path": path, "pattern": pattern})
+
+
+async def aget_code_structure(path: str) -> dict:
+    """Analyze code structure of a source file via AST (async variant of get_code_structure)."""
+    return await _acall_tool_cached("get_code_structure", {"path": path})
+
+
+async def awrite_file(path: str, content: str) -> dict:
+    """Create or overwrite a local file (async variant of write_file)."""
+    if len(content) > _STREAM_THRESHOLD:
+        return await awrite_file_streaming(path, content)
+    _READ_CACHE.clear()
+    return await _acall_tool("write_file", {"path": path, "content": content})
+
+
+async def awrite_file_streaming(path: str, content: str) -> dict:
+    """Chunked streaming upload (async variant of write_file_streaming)."""
+    _READ_CACHE.clear()
+    data = content.encode("utf-8") if isinstance(content, str) else content
+
+    async def _achunks():
+        for chunk in _iter_chunks(data):
+            yield chunk
+
+    resp = await _get_aclient().post(
+        _FILE_URL,
+        params={"path": path},
+        content=_achunks(),
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    resp.raise_for_status()
+    return _json_loads(resp.content)
+
+
+async def aedit_file(path: str, old_text: str, new_text: str) -> dict:
+    """Make a targeted text replacement in a file (async variant of edit_file)."""
+    _READ_CACHE.clear()
+    return await _acall_tool("edit_file", {"path": path, "old_text": old_text, "new_text": new_text})
+
+
+async def aedit_file_anchored(path: str, start_line: int, end_line: int,
+                              old_hash: str, new_text: str) -> dict:
+    """Replace a hash-anchored line range (async variant of edit_file_anchored)."""
+    _READ_CACHE.clear()
+    return await _acall_tool("edit_file_anchored", {
+        "path": path, "start_line": start_line, "end_line": end_line,
+        "old_hash": old_hash, "new_text": new_text,
+    })
+
+
+async def adiff_files(path_a: str, path_b: str) -> dict:
+    """Compare two files line by line (async variant of diff_files)."""
+    return await _acall_tool_cached("diff_files", {"path_a": path_a, "path_b": path_b})
+
+
+async def aexecute_command(command: str, working_directory: str = "") -> dict:
+    """Execute a shell command via cmd.exe — LAST RESORT (async variant of execute_command)."""
+    args: dict = {"command": command}
+    if working_directory:
+        args["working_directory"] = working_directory
+    _READ_CACHE.clear()
+    return await _acall_tool("execute_command", args)
+
+
+# ---------------------------------------------------------------------------
+# Tool registration — each function is wrapped in a single shared
+# FunctionTool at import, and its declaration is introspected once on
+# first use. Passing bare callables instead makes every agent replica
+# re-wrap the full tool set, and with dozens of coordinator replicas
+# that repeated reflection is a measurable slice of swarm rebuild time.
+# ---------------------------------------------------------------------------
+
+
+class _SharedTool(FunctionTool):
+    """FunctionTool that caches its declaration across agents and requests.
+
+    The schema comes from ADK's own signature/docstring parsing — only
+    the repeated re-introspection is skipped.
+    """
+
+    _declaration = None
+
+    def _get_declaration(self):
+        if self._declaration is None:
+            self._declaration = super()._get_declaration()
+        return self._declaration
+
+
+# search_files is registered through its cancellable async variant —
+# supersession cancellation needs an awaitable task to cancel, which the
+# blocking sync implementation cannot provide. wraps() keeps the name
+# and Args docstring, so the model-facing declaration is unchanged.
+@wraps(search_files)
+async def _registered_search_files(path: str, pattern: str, file_extensions: str = "",
+                                   offset: int = 0, limit: int = 0,
+                                   multiline: bool = False) -> dict:
+    return await asearch_files(path, pattern, file_extensions, offset, limit, multiline)
+
+
 # All bridge tools as a list for agent registration
 ALL_TOOLS = [
-    list_directory,
-    read_file,
-    read_file_section,
-    search_files,
-    find_file,
-    get_code_structure,
-    write_file,
-    edit_file,
-    diff_files,
-    execute_command,
+    _SharedTool(func)
+    for func in (
+        list_directory,
+        read_file,
+        read_file_section,
+        _registered_search_files,
+        find_file,
+        get_code_structure,
+        write_file,
+        edit_file,
+        edit_file_anchored,
+        diff_files,
+        execute_command,
+    )
+]
+
+# Async siblings for agents that support coroutine tools
+ALL_ASYNC_TOOLS = [
+    alist_directory,
+    aread_file,
+    aread_file_section,
+    asearch_files,
+    afind_file,
+    aget_code_structure,
+    awrite_file,
+    aedit_file,
+    aedit_file_anchored,
+    adiff_files,
+    aexecute_command,
 ]
@@ -0,0 +1,4 @@
+-- Migration 044: Composite index for the ADK sidecar's agent roster query
+-- (SELECT ... FROM gh_agents WHERE status = $1 ORDER BY created_at).
+-- Lets the planner use an index scan instead of a full table read + sort.
+CREATE INDEX IF NOT EXISTS gh_agents_status_created_at ON gh_agents (status, created_at);
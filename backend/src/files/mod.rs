@@ -532,7 +532,7 @@ async fn list_directory_inner(path: &str, show_hidden: bool) -> Result<Vec<FileE
 // ---------------------------------------------------------------------------
 
 /// Max content size for write_file (1 MB).
-const MAX_WRITE_SIZE: usize = 1024 * 1024;
+pub(crate) const MAX_WRITE_SIZE: usize = 1024 * 1024;
 
 /// Path prefixes that are blocked for writing.
 const BLOCKED_WRITE_PREFIXES: &[&str] = &[
@@ -551,19 +551,10 @@ pub fn validate_write_path(path: &str) -> Result<std::path::PathBuf, FileError>
     validate_and_canonicalize(path, BLOCKED_WRITE_PREFIXES)
 }
 
-/// Write content to a file with safety checks.
-pub async fn write_file(path: &str, content: &str) -> Result<String, FileError> {
-    if content.len() > MAX_WRITE_SIZE {
-        return Err(FileError {
-            path: path.to_string(),
-            reason: format!(
-                "Content too large: {} bytes (max {} bytes)",
-                content.len(),
-                MAX_WRITE_SIZE
-            ),
-        });
-    }
-
+/// Prepare a path for writing: create the parent directory if needed,
+/// then canonicalize and check the write blocklist. Shared by the buffered
+/// and streaming write paths.
+pub async fn prepare_write_path(path: &str) -> Result<std::path::PathBuf, FileError> {
     // Ensure parent directory exists BEFORE canonicalization (so parent can be resolved)
     if let Some(parent) = Path::new(path)
         .parent()
@@ -579,7 +570,23 @@ pub async fn write_file(path: &str, content: &str) -> Result<String, FileError>
 
     // Canonicalize BEFORE blocklist check — prevents ../ traversal bypass
     // For new files: canonicalize parent + rejoin filename
-    let canonical = validate_and_canonicalize(path, BLOCKED_WRITE_PREFIXES)?;
+    validate_and_canonicalize(path, BLOCKED_WRITE_PREFIXES)
+}
+
+/// Write content to a file with safety checks.
+pub async fn write_file(path: &str, content: &str) -> Result<String, FileError> {
+    if content.len() > MAX_WRITE_SIZE {
+        return Err(FileError {
+            path: path.to_string(),
+            reason: format!(
+                "Content too large: {} bytes (max {} bytes)",
+                content.len(),
+                MAX_WRITE_SIZE
+            ),
+        });
+    }
+
+    let canonical = prepare_write_path(path).await?;
 
     tokio::fs::write(&canonical, content)
         .await
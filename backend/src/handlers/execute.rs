@@ -5,8 +5,9 @@
 use std::time::Instant;
 
 use axum::Json;
-use axum::extract::State;
+use axum::extract::{Query, State};
 use axum::http::StatusCode;
+use axum::response::{IntoResponse, Response};
 use serde_json::{Value, json};
 use uuid::Uuid;
 
@@ -52,6 +53,236 @@ pub async fn internal_tool_execute(
     }
 }
 
+/// POST /api/internal/tool/batch — execute multiple tools in one round-trip.
+/// The ADK sidecar coalesces independent tool calls issued in the same agent
+/// step; tools run concurrently and results come back in request order.
+pub async fn internal_tool_execute_batch(
+    State(state): State<AppState>,
+    Json(body): Json<Value>,
+) -> Result<Json<Value>, ApiError> {
+    let calls = body["calls"]
+        .as_array()
+        .ok_or_else(|| ApiError::BadRequest("missing 'calls' array".into()))?;
+
+    // Read working_directory once for the whole batch
+    let wd: String = sqlx::query_scalar("SELECT working_directory FROM gh_settings WHERE id = 1")
+        .fetch_one(&state.db)
+        .await
+        .unwrap_or_default();
+
+    let results = futures_util::future::join_all(calls.iter().map(|call| {
+        let name = call["name"].as_str().unwrap_or_default().to_string();
+        let args = call.get("args").cloned().unwrap_or(json!({}));
+        let state = state.clone();
+        let wd = wd.clone();
+        async move {
+            match crate::tools::execute_tool(&name, &args, &state, &wd).await {
+                Ok(output) => json!({ "status": "success", "result": output.text }),
+                Err(e) => json!({ "status": "error", "result": e }),
+            }
+        }
+    }))
+    .await;
+
+    Ok(Json(json!({ "results": results })))
+}
+
+/// POST /api/internal/tool/multi_read — read many files in one round-trip.
+/// Disk reads run concurrently; the response maps each requested path to
+/// the same {status, result} shape the read_file tool returns.
+pub async fn internal_multi_read(
+    State(state): State<AppState>,
+    Json(body): Json<Value>,
+) -> Result<Json<Value>, ApiError> {
+    let paths = body["paths"]
+        .as_array()
+        .ok_or_else(|| ApiError::BadRequest("missing 'paths' array".into()))?;
+
+    let wd: String = sqlx::query_scalar("SELECT working_directory FROM gh_settings WHERE id = 1")
+        .fetch_one(&state.db)
+        .await
+        .unwrap_or_default();
+
+    let entries =
+        futures_util::future::join_all(paths.iter().filter_map(|p| p.as_str()).map(|path| {
+            let resolved = crate::tools::resolve_path(path, &wd);
+            let path = path.to_string();
+            async move {
+                let value = match crate::files::read_file_for_context(&resolved).await {
+                    Ok(ctx) => {
+                        let mut content = ctx.content;
+                        if ctx.truncated {
+                            content.push_str("\n... [file truncated]");
+                        }
+                        json!({ "status": "success", "result": content })
+                    }
+                    Err(e) => json!({
+                        "status": "error",
+                        "result": format!("Cannot read file '{}': {}", e.path, e.reason)
+                    }),
+                };
+                (path, value)
+            }
+        }))
+        .await;
+
+    let files: serde_json::Map<String, Value> = entries.into_iter().collect();
+    Ok(Json(json!({ "files": files })))
+}
+
+#[derive(serde::Deserialize)]
+pub struct InternalFileQuery {
+    pub path: String,
+}
+
+/// ETag for a file from its mtime + size — cheap to compute, changes on
+/// any write, good enough for conditional re-reads over loopback.
+async fn file_etag(path: &str) -> Option<String> {
+    let md = tokio::fs::metadata(path).await.ok()?;
+    let mtime = md
+        .modified()
+        .ok()
+        .and_then(|t| t.duration_since(std::time::UNIX_EPOCH).ok())
+        .map(|d| d.as_nanos())
+        .unwrap_or(0);
+    Some(format!("\"{:x}-{:x}\"", mtime, md.len()))
+}
+
+/// GET /api/internal/file?path=... — raw file bytes for the ADK sidecar.
+/// Serves contents as application/octet-stream with status and line count
+/// in headers, skipping the JSON escape/unescape both sides pay on the
+/// generic tool endpoint for large sources. Honors If-None-Match against
+/// an mtime+size ETag so unchanged re-reads cost a ~100-byte 304.
+pub async fn internal_file_read(
+    State(state): State<AppState>,
+    Query(query): Query<InternalFileQuery>,
+    request_headers: axum::http::HeaderMap,
+) -> Response {
+    let wd: String = sqlx::query_scalar("SELECT working_directory FROM gh_settings WHERE id = 1")
+        .fetch_one(&state.db)
+        .await
+        .unwrap_or_default();
+    let resolved = crate::tools::resolve_path(&query.path, &wd);
+
+    let etag = file_etag(&resolved).await;
+    if let (Some(etag), Some(if_none_match)) = (
+        &etag,
+        request_headers
+            .get(axum::http::header::IF_NONE_MATCH)
+            .and_then(|v| v.to_str().ok()),
+    ) && if_none_match == etag
+    {
+        return (
+            StatusCode::NOT_MODIFIED,
+            [("etag", etag.clone()), ("x-status", "success".to_string())],
+        )
+            .into_response();
+    }
+
+    match crate::files::read_file_for_context(&resolved).await {
+        Ok(ctx) => {
+            let line_count = ctx.content.lines().count();
+            let mut headers = vec![
+                ("content-type", "application/octet-stream".to_string()),
+                ("x-status", "success".to_string()),
+                ("x-line-count", line_count.to_string()),
+                ("x-truncated", ctx.truncated.to_string()),
+            ];
+            if let Some(etag) = etag {
+                headers.push(("etag", etag));
+            }
+            (axum::response::AppendHeaders(headers), ctx.content).into_response()
+        }
+        Err(e) => (
+            [("x-status", "error")],
+            format!("Cannot read file '{}': {}", e.path, e.reason),
+        )
+            .into_response(),
+    }
+}
+
+/// POST /api/internal/file?path=... — streaming file write for the ADK sidecar.
+/// Body chunks are written straight to disk, so a multi-MB generated file
+/// never needs the full content (or its JSON-escaped form) in memory on
+/// either side. Enforces the same path validation and size cap as write_file.
+pub async fn internal_file_write(
+    State(state): State<AppState>,
+    Query(query): Query<InternalFileQuery>,
+    body: axum::body::Body,
+) -> Json<Value> {
+    use futures_util::StreamExt;
+    use tokio::io::AsyncWriteExt;
+
+    let error = |msg: String| Json(json!({ "status": "error", "result": msg }));
+
+    let wd: String = sqlx::query_scalar("SELECT working_directory FROM gh_settings WHERE id = 1")
+        .fetch_one(&state.db)
+        .await
+        .unwrap_or_default();
+    let resolved = crate::tools::resolve_path(&query.path, &wd);
+
+    let canonical = match crate::files::prepare_write_path(&resolved).await {
+        Ok(p) => p,
+        Err(e) => return error(format!("Path rejected: {}", e.reason)),
+    };
+
+    // Stream into a temp file next to the destination and rename only after
+    // a successful flush — an interrupted or oversized upload must never
+    // destroy the existing file (the buffered write_file has the same
+    // all-or-nothing guarantee because it holds the full body up front).
+    let tmp = canonical.with_file_name(format!(
+        ".{}.{}.tmp",
+        canonical
+            .file_name()
+            .map(|n| n.to_string_lossy().into_owned())
+            .unwrap_or_default(),
+        std::process::id()
+    ));
+
+    let mut file = match tokio::fs::File::create(&tmp).await {
+        Ok(f) => f,
+        Err(e) => return error(format!("Cannot create file: {}", e)),
+    };
+
+    let mut stream = body.into_data_stream();
+    let mut written: usize = 0;
+    while let Some(chunk) = stream.next().await {
+        let chunk = match chunk {
+            Ok(c) => c,
+            Err(e) => {
+                let _ = tokio::fs::remove_file(&tmp).await;
+                return error(format!("Upload interrupted: {}", e));
+            }
+        };
+        written += chunk.len();
+        if written > crate::files::MAX_WRITE_SIZE {
+            let _ = tokio::fs::remove_file(&tmp).await;
+            return error(format!(
+                "Content too large: more than {} bytes",
+                crate::files::MAX_WRITE_SIZE
+            ));
+        }
+        if let Err(e) = file.write_all(&chunk).await {
+            let _ = tokio::fs::remove_file(&tmp).await;
+            return error(format!("Cannot write file: {}", e));
+        }
+    }
+    if let Err(e) = file.flush().await {
+        let _ = tokio::fs::remove_file(&tmp).await;
+        return error(format!("Cannot write file: {}", e));
+    }
+    drop(file);
+    if let Err(e) = tokio::fs::rename(&tmp, &canonical).await {
+        let _ = tokio::fs::remove_file(&tmp).await;
+        return error(format!("Cannot write file: {}", e));
+    }
+
+    Json(json!({
+        "status": "success",
+        "result": format!("Successfully wrote {} bytes to {}", written, canonical.display())
+    }))
+}
+
 // ---------------------------------------------------------------------------
 // HTTP Execute (Legacy)
 // ---------------------------------------------------------------------------
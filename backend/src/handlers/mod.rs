@@ -62,7 +62,10 @@ pub fn files_router(state: AppState) -> Router<AppState> {
 // ── Re-exports (backward-compatible) ─────────────────────────────────────────
 
 pub use agents::{classify_agent, create_agent, delete_agent, list_agents, update_agent};
-pub use execute::{execute, internal_tool_execute};
+pub use execute::{
+    execute, internal_file_read, internal_file_write, internal_multi_read, internal_tool_execute,
+    internal_tool_execute_batch,
+};
 pub use files_handlers::{browse_directory, list_files, read_file};
 pub use streaming::ws_execute;
 pub use system::{
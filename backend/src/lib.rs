@@ -251,6 +251,18 @@ fn create_router_inner(state: AppState, rate_limit: bool) -> Router {
         .route("/.well-known/agent-card.json", get(a2a::agent_card))
         // ADK sidecar internal tool bridge (localhost only, no auth)
         .route("/api/internal/tool", post(handlers::internal_tool_execute))
+        .route(
+            "/api/internal/tool/batch",
+            post(handlers::internal_tool_execute_batch),
+        )
+        .route(
+            "/api/internal/tool/multi_read",
+            post(handlers::internal_multi_read),
+        )
+        .route(
+            "/api/internal/file",
+            get(handlers::internal_file_read).post(handlers::internal_file_write),
+        )
         // GitHub OAuth (public — must be accessible to complete the auth flow)
         .route(
             "/api/auth/github/status",
@@ -290,6 +290,35 @@ async fn main() -> anyhow::Result<()> {
     print_banner(port);
     tracing::info!("GeminiHydra v15 backend listening on http://{}", addr);
 
+    // ── Optional Unix domain socket listener ──
+    // Same-host sidecars (the ADK bridge with RUST_BACKEND_URL=unix://<path>)
+    // skip the TCP stack entirely. Opt-in via UDS_PATH=<socket path>.
+    #[cfg(unix)]
+    if let Ok(uds_path) = std::env::var("UDS_PATH") {
+        // Remove a stale socket left by a previous run; bind fails otherwise.
+        let _ = tokio::fs::remove_file(&uds_path).await;
+        let uds_listener = tokio::net::UnixListener::bind(&uds_path)?;
+        tracing::info!(
+            "GeminiHydra v15 backend also listening on unix://{}",
+            uds_path
+        );
+        // UDS peers have no IP address; report loopback so ConnectInfo
+        // extractors and the per-IP rate limiters keep working.
+        let uds_app = app
+            .clone()
+            .layer(axum::extract::connect_info::MockConnectInfo(
+                std::net::SocketAddr::from(([127, 0, 0, 1], 0)),
+            ));
+        tokio::spawn(async move {
+            if let Err(e) = axum::serve(uds_listener, uds_app.into_make_service())
+                .with_graceful_shutdown(shutdown_signal())
+                .await
+            {
+                tracing::error!("UDS listener failed: {}", e);
+            }
+        });
+    }
+
     let listener = tokio::net::TcpListener::bind(addr).await?;
     axum::serve(
         listener,
@@ -113,7 +113,7 @@ const BLOCKED_PATTERNS: &[&str] = &[
 /// Resolve a path against the working directory.
 /// If the path is absolute or working_directory is empty, return it as-is.
 /// If relative and working_directory is non-empty, join them.
-fn resolve_path(raw: &str, working_directory: &str) -> String {
+pub(crate) fn resolve_path(raw: &str, working_directory: &str) -> String {
     let p = std::path::Path::new(raw);
     if p.is_absolute() || working_directory.is_empty() {
         raw.to_string()
@@ -151,6 +151,10 @@ pub fn list_available_tools() -> Vec<ToolInfo> {
             name: "edit_file",
             category: "filesystem",
         },
+        ToolInfo {
+            name: "edit_file_anchored",
+            category: "filesystem",
+        },
         ToolInfo {
             name: "delete_file",
             category: "filesystem",
@@ -425,6 +429,28 @@ pub async fn execute_tool(
                 .await
                 .map(ToolOutput::text)
         }
+        "edit_file_anchored" => {
+            let path = args["path"]
+                .as_str()
+                .ok_or("Missing required argument: path")?;
+            let resolved = resolve_path(path, working_directory);
+            let start_line = args["start_line"]
+                .as_u64()
+                .ok_or("Missing required argument: start_line")?
+                as usize;
+            let end_line = args["end_line"]
+                .as_u64()
+                .ok_or("Missing required argument: end_line")? as usize;
+            let old_hash = args["old_hash"]
+                .as_str()
+                .ok_or("Missing required argument: old_hash")?;
+            let new_text = args["new_text"]
+                .as_str()
+                .ok_or("Missing required argument: new_text")?;
+            tool_edit_file_anchored(&resolved, start_line, end_line, old_hash, new_text)
+                .await
+                .map(ToolOutput::text)
+        }
         "find_file" => {
             let path = args["path"]
                 .as_str()
@@ -1306,9 +1332,123 @@ async fn tool_read_file_section(
         out.push_str(&format!("{:>5} | {}\n", i + 1, lines[i]));
     }
 
+    // Anchor hash of the raw block — lets a follow-up edit_file_anchored
+    // reference this exact range without resending the old text.
+    let block_hash = anchor_hash(&lines[(start_line - 1)..actual_end].join("\n"));
+
+    Ok(format!(
+        "### {} (lines {}-{} of {}, block_hash {})\n{}",
+        path, start_line, actual_end, total_lines, block_hash, out
+    ))
+}
+
+// ---------------------------------------------------------------------------
+// edit_file_anchored
+// ---------------------------------------------------------------------------
+
+/// blake2b-128 hex digest of an anchored line block (lines joined with '\n').
+/// Must match the sidecar's hashlib.blake2b(..., digest_size=16).
+fn anchor_hash(block: &str) -> String {
+    use blake2::digest::consts::U16;
+    use blake2::{Blake2b, Digest};
+    let mut hasher = Blake2b::<U16>::new();
+    hasher.update(block.as_bytes());
+    hasher
+        .finalize()
+        .iter()
+        .map(|b| format!("{:02x}", b))
+        .collect()
+}
+
+/// Replace a line range whose content is identified by a 16-byte hash
+/// instead of the full old text — cheaper on the wire than edit_file's
+/// substring search for large blocks, and detects concurrent edits.
+async fn tool_edit_file_anchored(
+    path: &str,
+    start_line: usize,
+    end_line: usize,
+    old_hash: &str,
+    new_text: &str,
+) -> Result<String, String> {
+    if start_line == 0 {
+        return Err("start_line must be >= 1 (1-indexed)".to_string());
+    }
+    if end_line < start_line {
+        return Err(format!(
+            "end_line ({}) must be >= start_line ({})",
+            end_line, start_line
+        ));
+    }
+
+    if let Err(e) = crate::files::validate_write_path(path) {
+        return Err(format!("Path rejected: {}", e.reason));
+    }
+
+    let p = std::path::Path::new(path);
+    if !p.is_file() {
+        return Err(format!("File not found: {}", path));
+    }
+
+    let content = tokio::fs::read_to_string(p)
+        .await
+        .map_err(|e| format!("Failed to read file: {}", e))?;
+
+    // split_inclusive keeps each line's own terminator (\n or \r\n), so the
+    // splice below copies untouched lines back byte-for-byte — a range edit
+    // must not rewrite the line endings of the rest of the file.
+    let segments: Vec<&str> = content.split_inclusive('\n').collect();
+    if end_line > segments.len() {
+        return Err(format!(
+            "end_line {} exceeds file length ({} lines)",
+            end_line,
+            segments.len()
+        ));
+    }
+
+    let start_byte: usize = segments[..start_line - 1].iter().map(|s| s.len()).sum();
+    let range_len: usize = segments[(start_line - 1)..end_line]
+        .iter()
+        .map(|s| s.len())
+        .sum();
+    let end_byte = start_byte + range_len;
+
+    // The hash is over CR/LF-stripped lines joined with '\n', matching
+    // read_file_section's block_hash and the sidecar's anchor_hash().
+    let old_block = segments[(start_line - 1)..end_line]
+        .iter()
+        .map(|s| s.trim_end_matches('\n').trim_end_matches('\r'))
+        .collect::<Vec<_>>()
+        .join("\n");
+    let actual_hash = anchor_hash(&old_block);
+    if actual_hash != old_hash {
+        return Err(format!(
+            "Anchor mismatch for lines {}-{}: expected hash {}, found {} — the file changed since it was read; re-read the section and retry",
+            start_line, end_line, old_hash, actual_hash
+        ));
+    }
+
+    // Match the removed range's final terminator so the splice neither drops
+    // nor invents a newline at the seam.
+    let range_ends_with_newline = content[..end_byte].ends_with('\n');
+    let trimmed_new = new_text.strip_suffix('\n').unwrap_or(new_text);
+    let mut new_content =
+        String::with_capacity(content.len() - range_len + new_text.len() + 1);
+    new_content.push_str(&content[..start_byte]);
+    if !trimmed_new.is_empty() {
+        new_content.push_str(trimmed_new);
+        if range_ends_with_newline {
+            new_content.push('\n');
+        }
+    }
+    new_content.push_str(&content[end_byte..]);
+
+    tokio::fs::write(p, &new_content)
+        .await
+        .map_err(|e| format!("Failed to write file: {}", e))?;
+
     Ok(format!(
-        "### {} (lines {}-{} of {})\n{}",
-        path, start_line, actual_end, total_lines, out
+        "Successfully replaced lines {}-{} in {}",
+        start_line, end_line, path
     ))
 }
 